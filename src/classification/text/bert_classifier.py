@@ -48,6 +48,8 @@ class BertClassifier(TextEmotionClassifier):
             }
         )
         self.classifier = None
+        self.encoder_model = None
+        self.preprocessor = None
 
     def _build_classifier_model(self, parameters: Dict) -> tf.keras.Model:
         """
@@ -57,19 +59,21 @@ class BertClassifier(TextEmotionClassifier):
             dropout_rate: Dropout rate
             dense_layer: 0 means no additional layer, otherwise this is the
                 number of neurons in an additional dense layer
+            freeze_encoder: If True, only the classification head is
+                trained and the BERT encoder weights stay fixed
         :return: The keras model that classifies the text
         """
         dropout_rate = parameters.get("dropout_rate", 0.1)
         dense_layer = parameters.get("dense_layer", 0)
-        input_tensor = tf.keras.layers.Input(
-            shape=(), dtype=tf.string, name="text"
-        )
-        preprocessor = hub.KerasLayer(
-            self.preprocess_path, name="preprocessing"
-        )
-        encoder_inputs = preprocessor(input_tensor)
+        freeze_encoder = parameters.get("freeze_encoder", False)
+        encoder_inputs = {
+            name: tf.keras.layers.Input(
+                shape=(128,), dtype=tf.int32, name=name
+            )
+            for name in ["input_word_ids", "input_mask", "input_type_ids"]
+        }
         encoder = hub.KerasLayer(
-            self.model_path, trainable=True, name="BERT_encoder"
+            self.model_path, trainable=not freeze_encoder, name="BERT_encoder"
         )
         outputs = encoder(encoder_inputs)
         net = outputs["pooled_output"]
@@ -77,8 +81,16 @@ class BertClassifier(TextEmotionClassifier):
         if dense_layer:
             net = tf.keras.layers.Dense(dense_layer, activation="relu")(net)
         net = tf.keras.layers.Dense(
-            7, activation="softmax", name="classifier"
+            7, activation="softmax", name="classifier", dtype="float32"
         )(net)
+        self.encoder_model = tf.keras.Model(encoder_inputs, net)
+        self.preprocessor = hub.KerasLayer(
+            self.preprocess_path, name="preprocessing"
+        )
+        input_tensor = tf.keras.layers.Input(
+            shape=(), dtype=tf.string, name="text"
+        )
+        net = self.encoder_model(self.preprocessor(input_tensor))
         return tf.keras.Model(input_tensor, net)
 
     def train(self, parameters: Dict = None, **kwargs) -> None:
@@ -90,6 +102,9 @@ class BertClassifier(TextEmotionClassifier):
             epochs: Number of epochs to train for
             which_set: Which dataset to use for training
             batch_size: The batch size for training
+            precision: Keras precision policy, mixed_float16 by default
+                when a GPU is available
+            jit_compile: Whether to compile the train step with XLA
         :param kwargs: Additional parameters
             Not used currently
         """
@@ -100,42 +115,91 @@ class BertClassifier(TextEmotionClassifier):
         which_set = parameters.get("which_set", Set.TRAIN)
         batch_size = parameters.get("batch_size", 64)
         patience = parameters.get("patience", 5)
-
-        num_samples = self.data_reader.get_labels(which_set).shape[0]
-        num_train_steps = int(num_samples * epochs / batch_size)
-        self.classifier = self._build_classifier_model(parameters)
-        loss = tf.keras.losses.CategoricalCrossentropy()
-        metrics = [tf.metrics.CategoricalAccuracy()]
-        optimizer = optimization.create_optimizer(
-            init_lr=init_lr,
-            num_train_steps=num_train_steps,
-            num_warmup_steps=0.1 * num_train_steps,
-            optimizer_type="adamw",
-        )
-        callback = tf.keras.callbacks.EarlyStopping(
-            monitor="val_loss", patience=patience, restore_best_weights=True
-        )
-        self.classifier.compile(
-            optimizer=optimizer, loss=loss, metrics=metrics
+        precision = parameters.get(
+            "precision",
+            "mixed_float16"
+            if tf.config.list_physical_devices("GPU")
+            else "float32",
         )
+        previous_policy = tf.keras.mixed_precision.global_policy().name
+        tf.keras.mixed_precision.set_global_policy(precision)
 
-        train_data = self.data_reader.get_emotion_data(
-            self.emotions, which_set, batch_size, parameters
-        )
-        val_data = self.data_reader.get_emotion_data(
-            self.emotions, Set.VAL, batch_size
-        )
+        try:
+            strategy = tf.distribute.MirroredStrategy()
+            batch_size = batch_size * strategy.num_replicas_in_sync
+            num_samples = self.data_reader.get_labels(which_set).shape[0]
+            num_train_steps = int(num_samples * epochs / batch_size)
+            with strategy.scope():
+                self.classifier = self._build_classifier_model(parameters)
+                loss = tf.keras.losses.CategoricalCrossentropy()
+                metrics = [tf.metrics.CategoricalAccuracy()]
+                optimizer = optimization.create_optimizer(
+                    init_lr=init_lr,
+                    num_train_steps=num_train_steps,
+                    num_warmup_steps=0.1 * num_train_steps,
+                    optimizer_type="adamw",
+                )
+                if precision == "mixed_float16":
+                    optimizer = tf.keras.mixed_precision.LossScaleOptimizer(
+                        optimizer
+                    )
+                self.encoder_model.compile(
+                    optimizer=optimizer,
+                    loss=loss,
+                    metrics=metrics,
+                    jit_compile=parameters.get("jit_compile", False),
+                )
+            callback = tf.keras.callbacks.EarlyStopping(
+                monitor="val_loss",
+                patience=patience,
+                restore_best_weights=True,
+            )
 
-        history = self.classifier.fit(
-            x=train_data,
-            validation_data=val_data,
-            epochs=epochs,
-            callbacks=[callback],
-        )
+            train_data = self._tokenize_dataset(
+                self.data_reader.get_emotion_data(
+                    self.emotions, which_set, batch_size, parameters
+                )
+            )
+            val_data = self._tokenize_dataset(
+                self.data_reader.get_emotion_data(
+                    self.emotions, Set.VAL, batch_size
+                )
+            )
+
+            history = self.encoder_model.fit(
+                x=train_data,
+                validation_data=val_data,
+                epochs=epochs,
+                callbacks=[callback],
+            )
+        finally:
+            tf.keras.mixed_precision.set_global_policy(previous_policy)
         self.logger.log_end({"history": history})
 
         self.is_trained = True
 
+    def _tokenize_dataset(self, dataset: tf.data.Dataset) -> tf.data.Dataset:
+        """
+        Tokenize a text dataset once and cache the resulting tensors.
+        The static training texts are only pushed through the hub
+        preprocessing layer in the first epoch, later epochs replay the
+        cached token tensors.
+
+        :param dataset: Dataset of text and label batches
+        :return: Dataset of tokenized input and label batches
+        """
+        return (
+            dataset.map(
+                lambda texts, labels: (
+                    self.preprocessor(tf.reshape(texts, [-1])),
+                    labels,
+                ),
+                num_parallel_calls=tf.data.AUTOTUNE,
+            )
+            .cache()
+            .prefetch(tf.data.AUTOTUNE)
+        )
+
     def load(self, parameters: Dict = None, **kwargs) -> None:
         """
         Loading method for the BERT classifier that loads a stored model from
@@ -170,9 +234,59 @@ class BertClassifier(TextEmotionClassifier):
         save_path = parameters.get(
             "save_path", os.path.join("models", "text", "bert")
         )
-        self.classifier.save(save_path, include_optimizer=False)
+        serve = tf.function(
+            lambda texts: self.classifier(texts, training=False),
+            input_signature=[
+                tf.TensorSpec(shape=[None], dtype=tf.string, name="text")
+            ],
+        )
+        self.classifier.save(
+            save_path,
+            include_optimizer=False,
+            signatures={"serving_default": serve.get_concrete_function()},
+        )
         self.logger.save_logs(save_path)
 
+    def quantize(self, parameters: Dict = None, **kwargs) -> None:
+        """
+        Quantization method that converts a saved BERT model into a
+        smaller TFLite model for CPU deployment.
+
+        :param parameters: Quantization parameters
+            save_path: The folder where the trained model is saved
+            quantized_path: Output file for the TFLite model
+            precision: Either float16 weights or full int8 quantization
+        :param kwargs: Additional parameters
+            Not used currently
+        """
+        parameters = self.init_parameters(parameters, **kwargs)
+        save_path = parameters.get(
+            "save_path", os.path.join("models", "text", "bert")
+        )
+        quantized_path = parameters.get(
+            "quantized_path", os.path.join(save_path, "bert.tflite")
+        )
+        precision = parameters.get("precision", "float16")
+        assert precision in ["float16", "int8"]
+        converter = tf.lite.TFLiteConverter.from_saved_model(save_path)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if precision == "float16":
+            converter.target_spec.supported_types = [tf.float16]
+        else:
+            batch_size = parameters.get("batch_size", 64)
+            dataset = self.data_reader.get_emotion_data(
+                self.emotions, Set.VAL, batch_size, parameters
+            )
+            converter.representative_dataset = lambda: (
+                [tf.reshape(texts, [-1])] for texts, _ in dataset
+            )
+            converter.target_spec.supported_ops = [
+                tf.lite.OpsSet.TFLITE_BUILTINS_INT8,
+                tf.lite.OpsSet.SELECT_TF_OPS,
+            ]
+        with open(quantized_path, "wb") as tflite_file:
+            tflite_file.write(converter.convert())
+
     def classify(self, parameters: Dict = None, **kwargs) -> np.array:
         """
         Classify method for the BERT classifier
@@ -180,6 +294,7 @@ class BertClassifier(TextEmotionClassifier):
         :param parameters: Loading parameters
             which_set: Dataset to use for classification
             batch_size: Batch size
+            jit_compile: Whether to compile inference with XLA
         :param kwargs: Additional parameters
             Not used currently
         """
@@ -193,7 +308,13 @@ class BertClassifier(TextEmotionClassifier):
             raise RuntimeError(
                 "Please load or train the model before inference!"
             )
-        results = self.classifier.predict(dataset)
+        infer = tf.function(
+            lambda data: self.classifier(data, training=False),
+            jit_compile=parameters.get("jit_compile", False),
+        )
+        results = np.concatenate(
+            [infer(data).numpy() for data, _ in dataset], axis=0
+        )
         return np.argmax(results, axis=1)
 
 
@@ -140,7 +140,7 @@ class BalancedImageDataReader(ImageDataReader):
         )
 
         resampled_ds = self.add_augmentations(resampled_ds, augment)
-        return resampled_ds
+        return resampled_ds.prefetch(tf.data.AUTOTUNE)
 
     def _get_unbalanced_seven_emotion_data(
         self, which_set: Set, batch_size: int = 64, parameters: Dict = None
@@ -161,10 +161,39 @@ class BalancedImageDataReader(ImageDataReader):
         augment = parameters.get(
             "augment", True if which_set == Set.TRAIN else False
         )
+        dataset = self._get_cached_image_dataset(
+            which_set, parameters.get("snapshot_path")
+        )
+        if shuffle:
+            dataset = dataset.shuffle(
+                dataset.cardinality(), seed=parameters.get("seed")
+            )
+        dataset = dataset.batch(batch_size)
+        dataset = self.add_augmentations(dataset, augment)
+        dataset = dataset.prefetch(tf.data.AUTOTUNE)
+        options = tf.data.Options()
+        options.deterministic = True
+        return dataset.with_options(options)
+
+    def _get_cached_image_dataset(
+        self, which_set: Set, snapshot_path: str = None
+    ) -> tf.data.Dataset:
+        """
+        Read the images of one set into an unbatched dataset that caches
+        the decoded images in memory. Epochs after the first replay the
+        cache instead of re-reading and re-decoding the JPEG files, while
+        shuffling and augmentation stay random per epoch.
+
+        :param which_set: Which dataset to use - train, val or test
+        :param snapshot_path: If set, persist the decoded images to this
+            path on disk instead of caching in memory, so that later
+            pipelines skip the JPEG decode entirely
+        :return: The unbatched dataset of decoded images
+        """
         dataset = tf.keras.utils.image_dataset_from_directory(
             os.path.join(self.folder, self.folder_map[which_set]),
-            shuffle=shuffle,
-            batch_size=batch_size,
+            shuffle=False,
+            batch_size=None,
             image_size=(48, 48),
             label_mode="categorical",
             color_mode="grayscale",
@@ -178,8 +207,12 @@ class BalancedImageDataReader(ImageDataReader):
                 "neutral",
             ],
         )
-        dataset = self.add_augmentations(dataset, augment)
-        return dataset
+        if snapshot_path is not None:
+            return dataset.snapshot(
+                snapshot_path,
+                reader_func=lambda datasets: datasets.flat_map(lambda x: x),
+            )
+        return dataset.cache()
 
     def _get_unbalanced_three_emotion_data(
         self, which_set: Set, batch_size: int = 64, parameters: Dict = None
@@ -201,32 +234,27 @@ class BalancedImageDataReader(ImageDataReader):
         augment = parameters.get(
             "augment", True if which_set == Set.TRAIN else False
         )
-        dataset = tf.keras.utils.image_dataset_from_directory(
-            os.path.join(self.folder, self.folder_map[which_set]),
-            shuffle=shuffle,
-            batch_size=batch_size,
-            image_size=(48, 48),
-            label_mode="categorical",
-            color_mode="grayscale",
-            class_names=[
-                "angry",
-                "surprise",
-                "disgust",
-                "happy",
-                "fear",
-                "sad",
-                "neutral",
-            ],
+        dataset = self._get_cached_image_dataset(
+            which_set, parameters.get("snapshot_path")
         )
+        if shuffle:
+            dataset = dataset.shuffle(
+                dataset.cardinality(), seed=parameters.get("seed")
+            )
+        dataset = dataset.batch(batch_size)
         dataset = dataset.map(
             lambda x, y: tf.numpy_function(
                 func=self.map_emotions,
                 inp=[x, y],
                 Tout=(tf.float32, tf.float32),
-            )
+            ),
+            num_parallel_calls=tf.data.AUTOTUNE,
         )
         dataset = self.add_augmentations(dataset, augment)
-        return dataset
+        dataset = dataset.prefetch(tf.data.AUTOTUNE)
+        options = tf.data.Options()
+        options.deterministic = True
+        return dataset.with_options(options)
 
     def get_labels(
         self, which_set: Set = Set.TRAIN, parameters: Dict = None
@@ -243,13 +271,11 @@ class BalancedImageDataReader(ImageDataReader):
         dataset = self._get_unbalanced_seven_emotion_data(
             which_set, parameters=parameters
         )
-        all_labels = np.empty((0,))
+        all_labels = []
         for images, labels in dataset:
-            all_labels = np.concatenate(
-                [all_labels, np.argmax(labels.numpy(), axis=1)], axis=0
-            )
+            all_labels.append(np.argmax(labels.numpy(), axis=1))
 
-        return all_labels
+        return np.concatenate(all_labels, axis=0)
 
 
 def _main():  # pragma: no cover
@@ -108,13 +108,11 @@ class ComparisonTextDataReader(DataReader):
         """
         parameters = parameters or {}
         dataset = self.get_seven_emotion_data(which_set, parameters=parameters)
-        all_labels = np.empty((0,))
+        all_labels = []
         for images, labels in dataset:
-            all_labels = np.concatenate(
-                [all_labels, np.argmax(labels.numpy(), axis=1)], axis=0
-            )
+            all_labels.append(np.argmax(labels.numpy(), axis=1))
 
-        return all_labels
+        return np.concatenate(all_labels, axis=0)
 
 
 def _main():  # pragma: no cover
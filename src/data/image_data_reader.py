@@ -130,13 +130,11 @@ class ImageDataReader(DataReader):
         parameters = parameters or {}
         parameters.update({"shuffle": False})
         dataset = self.get_seven_emotion_data(which_set, parameters=parameters)
-        all_labels = np.empty((0,))
+        all_labels = []
         for images, labels in dataset:
-            all_labels = np.concatenate(
-                [all_labels, np.argmax(labels.numpy(), axis=1)], axis=0
-            )
+            all_labels.append(np.argmax(labels.numpy(), axis=1))
 
-        return all_labels
+        return np.concatenate(all_labels, axis=0)
 
     def add_augmentations(
         self, dataset: tf.data.Dataset, use_augmentations: bool = True
@@ -154,7 +152,9 @@ class ImageDataReader(DataReader):
 
         counter = tf.data.experimental.Counter()
         dataset = tf.data.Dataset.zip((dataset, (counter, counter)))
-        augmented_dataset = dataset.map(self._augment)
+        augmented_dataset = dataset.map(
+            self._augment, num_parallel_calls=tf.data.AUTOTUNE
+        )
 
         return augmented_dataset
 
@@ -30,6 +30,22 @@ class TextDataReader(DataReader):
             Set.VAL: "final_val.csv",
             Set.TEST: "final_test.csv",
         }
+        self._csv_cache = {}
+
+    def _read_csv(self, which_set: Set) -> pd.DataFrame:
+        """
+        Read the CSV file for one set, parsing it only once per reader
+        instance and serving repeated requests from memory.
+
+        :param which_set: Which dataset to use - train, val or test
+        :return: A copy of the parsed dataframe with text and label columns
+        """
+        if which_set not in self._csv_cache:
+            csv_file_path = os.path.join(self.folder, self.file_map[which_set])
+            self._csv_cache[which_set] = pd.read_csv(
+                csv_file_path, sep="\t", header=None, names=["text", "label"]
+            )
+        return self._csv_cache[which_set].copy()
 
     def get_seven_emotion_data(
         self, which_set: Set, batch_size: int = 64, parameters: Dict = None
@@ -46,10 +62,7 @@ class TextDataReader(DataReader):
         shuffle = parameters.get(
             "shuffle", True if which_set == Set.TRAIN else False
         )
-        csv_file_path = os.path.join(self.folder, self.file_map[which_set])
-        data = pd.read_csv(
-            csv_file_path, sep="\t", header=None, names=["text", "label"]
-        )
+        data = self._read_csv(which_set)
         labels = tf.keras.utils.to_categorical(data.pop("label"))
         dataset = tf.data.Dataset.from_tensor_slices((data, labels))
         if shuffle:
@@ -74,10 +87,7 @@ class TextDataReader(DataReader):
         shuffle = parameters.get(
             "shuffle", True if which_set == Set.TRAIN else False
         )
-        csv_file_path = os.path.join(self.folder, self.file_map[which_set])
-        data = pd.read_csv(
-            csv_file_path, sep="\t", header=None, names=["text", "label"]
-        )
+        data = self._read_csv(which_set)
         labels = data.pop("label")
         labels = self.convert_to_three_emotions(labels)
         labels = tf.keras.utils.to_categorical(labels)
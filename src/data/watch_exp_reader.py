@@ -1,10 +1,12 @@
 """ This data reader reads the Happimeter data from the experiments. """
 import copy
 import glob
+import hashlib
 import json
 import os
 import warnings
-from typing import Dict, Generator, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -44,6 +46,14 @@ class WatchExperimentDataReader(ExperimentDataReader):
             self.prepare_faceapi_labels()  # pragma: no cover
         self.raw_data = None
         self.raw_labels = None
+        self.raw_labels_onehot = None
+        self._raw_data_key = None
+        self._cv_cache = {}
+        self._data_indices = self.get_complete_data_indices()
+        self._index_map = {
+            part_id: index
+            for index, part_id in enumerate(self._data_indices)
+        }
 
     def get_seven_emotion_data(
         self, which_set: Set, batch_size: int = 64, parameters: Dict = None
@@ -57,20 +67,54 @@ class WatchExperimentDataReader(ExperimentDataReader):
         :return: Dataset instance.
         """
         parameters = parameters or {}
+        dataset = self._get_sample_dataset(which_set, parameters)
+        return self._finalize_dataset(
+            dataset, which_set, batch_size, parameters
+        )
+
+    def _get_sample_dataset(
+        self, which_set: Set, parameters: Dict
+    ) -> tf.data.Dataset:
+        """
+        Create the unbatched dataset of windows and one-hot labels.
+
+        :param which_set: Which set to use.
+        :param parameters: Additional parameters.
+        :return: Dataset of single samples.
+        """
         self.get_raw_data(parameters)
-        dataset = tf.data.Dataset.from_generator(
-            self.get_data_generator(which_set, parameters),
-            output_types=(tf.float32, tf.float32),
-            output_shapes=(
-                tf.TensorShape([*self.get_input_shape(parameters)]),
-                tf.TensorShape([7]),
-            ),
+        indices = self.get_cross_validation_indices(which_set, parameters)
+        return tf.data.Dataset.from_tensor_slices(
+            (self.raw_data[indices], self.raw_labels_onehot[indices])
         )
+
+    def _finalize_dataset(
+        self,
+        dataset: tf.data.Dataset,
+        which_set: Set,
+        batch_size: int,
+        parameters: Dict,
+    ) -> tf.data.Dataset:
+        """
+        Shuffle, batch and prefetch a sample dataset and apply the
+        pipeline optimization options.
+
+        :param dataset: The unbatched sample dataset.
+        :param which_set: Which set to use.
+        :param batch_size: Batch size for the dataset.
+        :param parameters: Additional parameters.
+        :return: The batched and prefetched dataset.
+        """
         if parameters.get(
             "shuffle", True if which_set == Set.TRAIN else False
         ):
             dataset = dataset.shuffle(1024)
-        dataset = dataset.batch(batch_size)
+        dataset = dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+        options = tf.data.Options()
+        options.experimental_optimization.map_and_batch_fusion = True
+        options.experimental_optimization.map_fusion = True
+        options.autotune.enabled = True
+        dataset = dataset.with_options(options)
         return dataset
 
     def get_data_generator(
@@ -88,13 +132,9 @@ class WatchExperimentDataReader(ExperimentDataReader):
         def generator():
             indices = self.get_cross_validation_indices(which_set, parameters)
             for data_index in indices:
-                data = self.raw_data[data_index]
-                label = self.raw_labels[data_index]
                 yield (
-                    data,
-                    tf.keras.utils.to_categorical(
-                        np.array(label), num_classes=7
-                    ),
+                    self.raw_data[data_index],
+                    self.raw_labels_onehot[data_index],
                 )
 
         return generator
@@ -112,6 +152,9 @@ class WatchExperimentDataReader(ExperimentDataReader):
         :return: List of indexes in a cv form.
         """
         cv_portions = parameters.get("cv_splits", 5)
+        cache_key = (which_set, cv_portions, parameters.get("cv_index", 0))
+        if cache_key in self._cv_cache:
+            return self._cv_cache[cache_key]
         if which_set == Set.ALL:
             indices = []
             cv_params = copy.deepcopy(parameters)
@@ -120,6 +163,7 @@ class WatchExperimentDataReader(ExperimentDataReader):
                 indices.extend(
                     self.get_cross_validation_indices(Set.TEST, cv_params)
                 )
+            self._cv_cache[cache_key] = indices
             return indices
         cv_index = parameters.get("cv_index", 0)
         assert cv_portions - 1 >= cv_index >= 0
@@ -131,22 +175,18 @@ class WatchExperimentDataReader(ExperimentDataReader):
             ).astype(int)
             if which_set == Set.TEST:
                 test_split = cv_portions - cv_index
-                all_indices.extend(
-                    list(
-                        emotion_samples[
-                            borders[test_split - 1] : borders[test_split]
-                        ]
-                    )
+                all_indices.append(
+                    emotion_samples[
+                        borders[test_split - 1] : borders[test_split]
+                    ]
                 )
             elif which_set == Set.VAL:
                 val_split = (cv_portions - 1 - cv_index) % cv_portions
                 val_split = val_split - 1 if val_split == 0 else val_split
-                all_indices.extend(
-                    list(
-                        emotion_samples[
-                            borders[val_split - 1] : borders[val_split]
-                        ]
-                    )
+                all_indices.append(
+                    emotion_samples[
+                        borders[val_split - 1] : borders[val_split]
+                    ]
                 )
             elif which_set == Set.TRAIN:
                 for i in range(1, cv_portions - 1):
@@ -154,14 +194,14 @@ class WatchExperimentDataReader(ExperimentDataReader):
                     train_split = (
                         train_split - 1 if train_split == 0 else train_split
                     )
-                    all_indices.extend(
-                        list(
-                            emotion_samples[
-                                borders[train_split - 1] : borders[train_split]
-                            ]
-                        )
+                    all_indices.append(
+                        emotion_samples[
+                            borders[train_split - 1] : borders[train_split]
+                        ]
                     )
-        all_indices.sort()
+        if all_indices:
+            all_indices = np.sort(np.concatenate(all_indices)).tolist()
+        self._cv_cache[cache_key] = all_indices
         return all_indices
 
     def get_three_emotion_data(
@@ -175,17 +215,20 @@ class WatchExperimentDataReader(ExperimentDataReader):
         :param parameters: Additional parameters
         :return: Dataset with three emotion labels.
         """
-        dataset = self.get_seven_emotion_data(
-            which_set, batch_size, parameters
-        )
+        parameters = parameters or {}
+        dataset = self._get_sample_dataset(which_set, parameters)
+        conversion = tf.constant([2, 0, 2, 0, 2, 2, 1], dtype=tf.int32)
+
+        def map_emotions(data, labels):
+            three_labels = tf.gather(conversion, tf.argmax(labels, axis=-1))
+            return data, tf.one_hot(three_labels, 3)
+
         dataset = dataset.map(
-            lambda x, y: tf.numpy_function(
-                func=self.map_emotions,
-                inp=[x, y],
-                Tout=(tf.float32, tf.float32),
-            )
+            map_emotions, num_parallel_calls=tf.data.AUTOTUNE
+        )
+        return self._finalize_dataset(
+            dataset, which_set, batch_size, parameters
         )
-        return dataset
 
     def get_labels(
         self, which_set: Set = Set.TRAIN, parameters: Dict = None
@@ -198,14 +241,9 @@ class WatchExperimentDataReader(ExperimentDataReader):
         :return: Label numpy array
         """
         parameters = parameters or {}
-        parameters["shuffle"] = False
-        dataset = self.get_seven_emotion_data(which_set, 100, parameters)
-        labels = np.empty((0,))
-        for _, batch_labels in dataset:
-            labels = np.concatenate(
-                [labels, np.argmax(batch_labels, axis=1)], axis=0
-            )
-        return labels
+        self.get_raw_data(parameters)
+        indices = self.get_cross_validation_indices(which_set, parameters)
+        return self.raw_labels[indices]
 
     def get_raw_labels(self, label_mode: str) -> np.ndarray:
         """
@@ -216,7 +254,7 @@ class WatchExperimentDataReader(ExperimentDataReader):
         :param label_mode: Whether to use expected or faceapi labels
         :return: Array of all labels in shape (file, second)
         """
-        raw_labels = np.zeros((len(self.get_complete_data_indices()), 690))
+        raw_labels = np.zeros((len(self._data_indices), 690))
         if label_mode == "expected":
             raw_labels = self.get_raw_expected_labels()
         elif label_mode == "faceapi":
@@ -236,7 +274,7 @@ class WatchExperimentDataReader(ExperimentDataReader):
 
         :return: Labels that are expected from the user.
         """
-        labels = np.zeros((len(self.get_complete_data_indices()), 690))
+        labels = np.zeros((len(self._data_indices), 690))
         for emotion, times in self.emotion_times.items():
             start_time = (
                 0 if int(times["start"]) == 0 else int(times["start"]) + 1
@@ -252,7 +290,7 @@ class WatchExperimentDataReader(ExperimentDataReader):
 
         :return: Labels that are collected from the user's face expression.
         """
-        data_indices = self.get_complete_data_indices()
+        data_indices = self._data_indices
         gt_folder = os.path.join("data", "ground_truth")
         labels = np.zeros((len(data_indices), 690))
         emotions_sorted = [
@@ -273,19 +311,21 @@ class WatchExperimentDataReader(ExperimentDataReader):
             )[0]
             with open(ground_truth_file, "r") as emotions_file:
                 raw_emotions = json.load(emotions_file)
-            previous = None
-            for time, emotion_probs in raw_emotions:
-                time_index = int(float(time)) - 1
-                if emotion_probs != ["undefined"]:
-                    emotion_probs_sorted = [
-                        emotion_probs[0][emotion]
-                        for emotion in emotions_sorted
-                    ]
-                    label = np.argmax(emotion_probs_sorted)
-                    previous = label
-                else:
-                    label = previous
-                labels[file_index, time_index] = label
+            times = np.array(
+                [int(float(time)) - 1 for time, _ in raw_emotions]
+            )
+            defined = [
+                index
+                for index, (_, probs) in enumerate(raw_emotions)
+                if probs != ["undefined"]
+            ]
+            probabilities = pd.DataFrame(
+                [raw_emotions[index][1][0] for index in defined]
+            )[emotions_sorted]
+            values = np.full(len(raw_emotions), np.nan)
+            values[defined] = np.argmax(probabilities.to_numpy(), axis=1)
+            values = pd.Series(values).ffill().to_numpy()
+            labels[file_index, times] = values
         return labels
 
     @staticmethod
@@ -308,15 +348,32 @@ class WatchExperimentDataReader(ExperimentDataReader):
         """
         Load the raw watch data from the csv files and split it into
         windows according to the parameters.
+        The windowed arrays are cached on disk per parameter combination,
+        so repeated runs skip the CSV parsing entirely. If the in-memory
+        arrays already belong to the requested configuration, the call
+        returns immediately and keeps the memoized CV indices.
 
         :param parameters: Additional parameters
         """
         window = parameters.get("window", 20)
         normalize = parameters.get("normalize", True)
         hop = parameters.get("hop", 5)
-        all_labels = self.get_raw_labels(
-            parameters.get("label_mode", self.default_label_mode)
-        )
+        label_mode = parameters.get("label_mode", self.default_label_mode)
+        use_cache = parameters.get("cache", True)
+        cache_path = self._get_cache_path(window, hop, normalize, label_mode)
+        if self.raw_data is not None and self._raw_data_key == cache_path:
+            return
+        if use_cache and os.path.exists(cache_path):
+            cached = np.load(cache_path)
+            self.raw_data = cached["data"].astype(np.float32, copy=False)
+            self.raw_labels = cached["labels"]
+            self.raw_labels_onehot = np.eye(7, dtype=np.float32)[
+                self.raw_labels.astype(np.int64)
+            ]
+            self._raw_data_key = cache_path
+            self._cv_cache = {}
+            return
+        all_labels = self.get_raw_labels(label_mode)
         columns = [
             "Heartrate",
             "AccelerometerX",
@@ -326,45 +383,113 @@ class WatchExperimentDataReader(ExperimentDataReader):
         ]
         if normalize:
             columns = [f"{col}Norm" for col in columns.copy()]
-        raw_data = np.empty((0, window, 5))
-        raw_labels = np.empty((0,))
-        for part_id in self.get_complete_data_indices():
-            part_data = np.empty((0, window, 5))
-            part_labels = np.empty((0,))
-            for emotion in self.emotions:
-                file = glob.glob(
-                    f"{os.path.join(self.folder, emotion)}/{part_id:03d}*.csv"
-                )
-                if not len(file):
-                    warnings.warn(
-                        f"Happimeter data file for participant {part_id} "
-                        f"and emotion {emotion} not found!"
-                    )
-                    continue
-                data = pd.read_csv(file[0], delimiter=",", usecols=columns)
-                seconds = pd.read_csv(
-                    file[0], delimiter=",", usecols=["Second"]
+        with ThreadPoolExecutor() as executor:
+            results = list(
+                executor.map(
+                    lambda part_id: self._load_participant_data(
+                        part_id, columns, window, hop, all_labels
+                    ),
+                    self._data_indices,
                 )
-                for second in range(window, len(data), hop):
-                    index = self.get_complete_data_indices().index(part_id)
-                    label = all_labels[index, seconds.values[second][0]]
-                    sample = np.expand_dims(
-                        data.values[(second - window) : second, :], axis=0
-                    )
-                    part_data = np.concatenate([part_data, sample], axis=0)
-                    part_labels = np.concatenate(
-                        [part_labels, np.array([label])], axis=0
-                    )
-            # Normalize
-            if part_data.size:
-                raw_data = np.concatenate(
-                    [raw_data, part_data[part_labels != -1]], axis=0
+            )
+        results = [result for result in results if result is not None]
+        self.raw_data = np.concatenate(
+            [data for data, _ in results], axis=0
+        )
+        self.raw_labels = np.concatenate(
+            [labels for _, labels in results], axis=0
+        )
+        self.raw_labels_onehot = np.eye(7, dtype=np.float32)[
+            self.raw_labels.astype(np.int64)
+        ]
+        self._raw_data_key = cache_path
+        self._cv_cache = {}
+        if use_cache:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as cache_file:
+                np.savez(
+                    cache_file, data=self.raw_data, labels=self.raw_labels
                 )
-                raw_labels = np.concatenate(
-                    [raw_labels, part_labels[part_labels != -1]], axis=0
+            os.replace(temp_path, cache_path)
+
+    def _load_participant_data(
+        self,
+        part_id: int,
+        columns: List[str],
+        window: int,
+        hop: int,
+        all_labels: np.ndarray,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Load and window the emotion CSV files of a single participant.
+
+        :param part_id: The id of the participant to load.
+        :param columns: The CSV feature columns to use.
+        :param window: The length of the window to use in seconds
+        :param hop: The hop between consecutive windows in seconds
+        :param all_labels: Array of per second labels for all experiments.
+        :return: Windows and labels of this participant, or None if no
+            data files exist.
+        """
+        index = self._index_map[part_id]
+        part_data = []
+        part_labels = []
+        for emotion in self.emotions:
+            file = glob.glob(
+                f"{os.path.join(self.folder, emotion)}/{part_id:03d}*.csv"
+            )
+            if not len(file):
+                warnings.warn(
+                    f"Happimeter data file for participant {part_id} "
+                    f"and emotion {emotion} not found!"
                 )
-        self.raw_data = raw_data
-        self.raw_labels = raw_labels
+                continue
+            data = pd.read_csv(
+                file[0], delimiter=",", usecols=columns + ["Second"]
+            )
+            seconds = data.pop("Second").to_numpy()
+            data = data[columns].to_numpy(dtype=np.float32)
+            starts = np.arange(window, len(data), hop)
+            if not starts.size:
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(
+                data, window, axis=0
+            )[starts - window].transpose(0, 2, 1)
+            labels = all_labels[index, seconds[starts]]
+            part_data.append(windows)
+            part_labels.append(labels)
+        if not part_data:
+            return None
+        part_data = np.concatenate(part_data, axis=0)
+        part_labels = np.concatenate(part_labels, axis=0)
+        return part_data[part_labels != -1], part_labels[part_labels != -1]
+
+    def _get_cache_path(
+        self, window: int, hop: int, normalize: bool, label_mode: str
+    ) -> str:
+        """
+        Compute the cache file path for one raw data configuration.
+
+        :param window: The length of the window to use in seconds
+        :param hop: The hop between consecutive windows in seconds
+        :param normalize: Whether normalized columns are used
+        :param label_mode: Whether to use expected or faceapi labels
+        :return: Path of the npz file that caches this configuration.
+        """
+        key = hashlib.md5(
+            json.dumps(
+                {
+                    "folder": self.folder,
+                    "window": window,
+                    "hop": hop,
+                    "normalize": normalize,
+                    "label_mode": label_mode,
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+        return os.path.join(".cache", f"watch_{key}.npz")
 
     @staticmethod
     def get_input_shape(parameters: Dict) -> tuple:
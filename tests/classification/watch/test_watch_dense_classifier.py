@@ -29,7 +29,7 @@ def test_dense_initialization():
     )
     with pytest.raises(RuntimeError):
         # Error because not trained
-        classifier.classify()
+        classifier.classify({"cache": False})
 
 
 @pytest.mark.filterwarnings("ignore:Happimeter data:UserWarning")
@@ -43,6 +43,7 @@ def test_dense_workflow():
         "epochs": 1,
         "which_set": Set.VAL,
         "batch_size": 8,
+        "cache": False,
         "shuffle": False,
         "window": 10,
         "hop": 5,
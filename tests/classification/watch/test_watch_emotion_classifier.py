@@ -67,7 +67,9 @@ def test_prepare_data():
     classifier.data_reader = WatchExperimentDataReader(
         folder=os.path.join("tests", "test_data", "watch")
     )
-    classifier.prepare_data({"which_set": Set.VAL, "batch_size": 8})
+    classifier.prepare_data(
+        {"which_set": Set.VAL, "batch_size": 8, "cache": False}
+    )
     members = ["train_data", "val_data"]
     for member in members:
         assert classifier.__getattribute__(member) is not None
@@ -82,7 +84,12 @@ def test_weights():
         folder=os.path.join("tests", "test_data", "watch")
     )
     classifier.prepare_data(
-        {"which_set": Set.VAL, "batch_size": 8, "weighted": True}
+        {
+            "which_set": Set.VAL,
+            "batch_size": 8,
+            "weighted": True,
+            "cache": False,
+        }
     )
     members = ["train_data", "val_data", "class_weights"]
     for member in members:
@@ -96,7 +103,12 @@ def test_balancing():
         folder=os.path.join("tests", "test_data", "watch")
     )
     classifier.prepare_data(
-        {"which_set": Set.VAL, "batch_size": 8, "balanced": True}
+        {
+            "which_set": Set.VAL,
+            "batch_size": 8,
+            "balanced": True,
+            "cache": False,
+        }
     )
     members = ["train_data", "val_data"]
     for member in members:
@@ -9,6 +9,40 @@ import tensorflow as tf
 from src.data.balanced_image_data_reader import BalancedImageDataReader, Set
 
 
+@pytest.fixture(scope="module")
+def image_dr():
+    return BalancedImageDataReader(
+        folder=os.path.join("tests", "test_data", "image")
+    )
+
+
+@pytest.fixture(scope="session")
+def snapshot_path(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("snapshot"))
+
+
+@pytest.fixture
+def isolated_image_dir(tmp_path):
+    import shutil
+
+    shutil.copytree(
+        os.path.join("tests", "test_data", "image"), tmp_path / "image"
+    )
+    return tmp_path / "image"
+
+
+@pytest.fixture
+def extra_angry_files(isolated_image_dir):
+    angry_dir = isolated_image_dir / "train" / "angry"
+    source_image = os.path.abspath(angry_dir / "fer_35854.jpeg")
+    paths = [angry_dir / f"fer_35854_copy{i}.jpeg" for i in range(7)]
+    for path in paths:
+        os.symlink(source_image, path)
+    yield
+    for path in paths:
+        os.remove(path)
+
+
 def test_initialization():
     dr = BalancedImageDataReader()
     assert dr.name == "balanced_image"
@@ -17,93 +51,76 @@ def test_initialization():
         assert dr.folder_map[set_type] == set_type.name.lower()
 
 
-def test_reading():
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
-    )
-    assert dr.folder == os.path.join("tests", "test_data", "image")
-    dataset = dr.get_emotion_data(
+def test_reading(image_dr):
+    assert image_dr.folder == os.path.join("tests", "test_data", "image")
+    dataset = image_dr.get_emotion_data(
         "neutral_ekman",
         Set.TRAIN,
         batch_size=10,
         parameters={"shuffle": False},
     )
     assert isinstance(dataset, tf.data.Dataset)
-    batch = 0
-    for images, labels in dataset:
-        batch += 1
-        assert images.numpy().shape == (7, 48, 48, 1)
-        assert labels.numpy().shape == (7, 7)
-        assert np.array_equal(
-            labels.numpy()[[0, 6, 1, 3, 2, 5, 4], :], np.eye(7)
-        )
-    assert batch == 1
+    assert tf.data.experimental.cardinality(dataset).numpy() == 1
+    images, labels = next(iter(dataset.take(1)))
+    labels = labels.numpy()
+    assert images.numpy().shape == (7, 48, 48, 1)
+    assert labels.shape == (7, 7)
+    assert np.array_equal(labels[[0, 6, 1, 3, 2, 5, 4], :], np.eye(7))
 
     with pytest.raises(ValueError):
-        _ = dr.get_emotion_data("wrong")
+        _ = image_dr.get_emotion_data("wrong")
 
 
-def test_reading_three():
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
-    )
-    assert dr.folder == os.path.join("tests", "test_data", "image")
-    dataset = dr.get_emotion_data(
+def test_reading_three(image_dr):
+    assert image_dr.folder == os.path.join("tests", "test_data", "image")
+    dataset = image_dr.get_emotion_data(
         "three", Set.TRAIN, batch_size=2, parameters={"shuffle": False}
     )
-    seven_dataset = dr.get_emotion_data(
+    seven_dataset = image_dr.get_emotion_data(
         "neutral_ekman", Set.TRAIN, batch_size=2, parameters={"shuffle": False}
-    ).as_numpy_iterator()
+    )
     assert isinstance(dataset, tf.data.Dataset)
+    three_batches = list(dataset.as_numpy_iterator())
+    seven_batches = list(seven_dataset.as_numpy_iterator())
     batch = 0
-    conversion_dict = {0: 2, 1: 0, 2: 2, 3: 0, 4: 2, 5: 2, 6: 1}
-    for images, labels in dataset:
-        seven_images, seven_labels = next(seven_dataset)
-        assert np.array_equal(seven_images, images.numpy())
+    conversion = np.array([2, 0, 2, 0, 2, 2, 1])
+    for (images, labels), (seven_images, seven_labels) in zip(
+        three_batches, seven_batches
+    ):
+        assert np.array_equal(seven_images, images)
         batch += 1
         if batch <= 3:
-            assert images.numpy().shape == (2, 48, 48, 1)
-            assert labels.numpy().shape == (2, 3)
-            for index, label in enumerate(labels.numpy()):
-                assert (
-                    np.argmax(label)
-                    == conversion_dict[int(np.argmax(seven_labels[index, :]))]
-                )
-                assert label.shape == (3,)
-                assert np.sum(label) == 1
+            assert images.shape == (2, 48, 48, 1)
+            assert labels.shape == (2, 3)
         elif batch == 4:
-            assert images.numpy().shape == (1, 48, 48, 1)
-            assert labels.numpy().shape == (1, 3)
-            for index, label in enumerate(labels.numpy()):
-                assert (
-                    np.argmax(label)
-                    == conversion_dict[int(np.argmax(seven_labels[index, :]))]
-                )
-                assert label.shape == (3,)
-                assert np.sum(label) == 1
+            assert images.shape == (1, 48, 48, 1)
+            assert labels.shape == (1, 3)
+        assert np.array_equal(
+            np.argmax(labels, axis=1),
+            conversion[np.argmax(seven_labels, axis=1)],
+        )
+        assert np.all(labels.sum(axis=1) == 1)
     assert batch == 4
 
 
-def test_labels():
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
-    )
-    dataset = dr.get_emotion_data(
+def test_labels(image_dr):
+    dataset = image_dr.get_emotion_data(
         "neutral_ekman", Set.TRAIN, batch_size=5, parameters={"shuffle": False}
     )
-    dataset_labels = np.empty((0,))
-    dataset_data = np.empty((0, 48, 48, 1))
-    dataset_raw_labels = np.empty((0, 7))
+    data_chunks = []
+    raw_label_chunks = []
+    label_chunks = []
     for data, labels in dataset:
-        dataset_data = np.concatenate([dataset_data, data.numpy()], axis=0)
+        data_chunks.append(data.numpy())
         labels = labels.numpy()
-        dataset_raw_labels = np.concatenate(
-            [dataset_raw_labels, labels], axis=0
-        )
+        raw_label_chunks.append(labels)
         labels = np.argmax(labels, axis=1)
         assert labels.shape == (5,) or labels.shape == (2,)
-        dataset_labels = np.concatenate([dataset_labels, labels], axis=0)
-    true_labels = dr.get_labels(Set.TRAIN)
+        label_chunks.append(labels)
+    dataset_data = np.concatenate(data_chunks, axis=0)
+    dataset_raw_labels = np.concatenate(raw_label_chunks, axis=0)
+    dataset_labels = np.concatenate(label_chunks, axis=0)
+    true_labels = image_dr.get_labels(Set.TRAIN)
     assert true_labels.shape == (7,)
     assert dataset_labels.shape == (7,)
     assert np.array_equal(true_labels, dataset_labels)
@@ -112,45 +129,42 @@ def test_labels():
     assert np.array_equal(d_labels, dataset_raw_labels)
 
     # Now with shuffle
-    trials = 0
-    equal = True
-    while equal:
-        if trials > 3:
-            raise RuntimeError("Shuffle not working.")
-        dataset = dr.get_emotion_data(
-            "neutral_ekman",
-            Set.TRAIN,
-            batch_size=7,
-            parameters={"shuffle": True},
-        )
-        dataset_labels = np.empty((0,))
-        for _, labels in dataset:
-            labels = labels.numpy()
-            labels = np.argmax(labels, axis=1)
-            dataset_labels = np.concatenate([dataset_labels, labels], axis=0)
-            assert labels.shape == (7,)
-        trials += 1
-        equal = np.array_equal(true_labels, dataset_labels)
-    assert not equal
+    dataset = image_dr.get_emotion_data(
+        "neutral_ekman",
+        Set.TRAIN,
+        batch_size=7,
+        parameters={"shuffle": True, "seed": 42},
+    )
+    all_labels = dataset.map(lambda x, y: y).reduce(
+        tf.zeros([0, 7]), lambda acc, y: tf.concat([acc, y], axis=0)
+    )
+    dataset_labels = np.argmax(all_labels.numpy(), axis=1)
+    assert dataset_labels.shape == (7,)
+    assert not np.array_equal(true_labels, dataset_labels)
 
 
-def test_augmentation():
+def test_augmentation(image_dr, snapshot_path):
     tf.random.set_seed(42)
 
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
-    )
-    dataset = dr.get_emotion_data(
+    dataset = image_dr.get_emotion_data(
         "neutral_ekman",
         Set.TRAIN,
         batch_size=5,
-        parameters={"shuffle": False, "augment": False},
+        parameters={
+            "shuffle": False,
+            "augment": False,
+            "snapshot_path": snapshot_path,
+        },
     )
-    augmented_dataset = dr.get_emotion_data(
+    augmented_dataset = image_dr.get_emotion_data(
         "neutral_ekman",
         Set.TRAIN,
         batch_size=5,
-        parameters={"shuffle": False, "augment": True},
+        parameters={
+            "shuffle": False,
+            "augment": True,
+            "snapshot_path": snapshot_path,
+        },
     )
     for batch, aug_batch in zip(dataset, augmented_dataset):
         images, labels = batch
@@ -158,104 +172,40 @@ def test_augmentation():
         assert np.array_equal(labels.numpy(), aug_labels.numpy())
         assert not np.array_equal(images.numpy(), aug_images.numpy())
 
-    counter = 0
-    for batch, manual_batch in zip(augmented_dataset, dataset):
-        images, labels = batch
-        manual_images, manual_labels = dr._augment(
-            manual_batch, (counter, counter + 1)
-        )
-        assert np.array_equal(labels.numpy(), manual_labels.numpy())
-        counter += 2
-        assert images.shape == manual_images.shape
-    assert counter == 4
+    images, labels = BalancedImageDataReader.convert_to_numpy(
+        augmented_dataset
+    )
+    manual_data = BalancedImageDataReader.convert_to_numpy(dataset)
+    manual_images, manual_labels = image_dr._augment(
+        manual_data, (0, images.shape[0])
+    )
+    assert np.array_equal(labels, manual_labels.numpy())
+    assert images.shape == manual_images.shape
 
 
-def test_balanced_three():
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
-    )
-    assert dr.folder == os.path.join("tests", "test_data", "image")
+def test_balanced_three(image_dr):
+    assert image_dr.folder == os.path.join("tests", "test_data", "image")
     with pytest.raises(NotImplementedError):
-        _ = dr.get_emotion_data(
+        _ = image_dr.get_emotion_data(
             "three", Set.TRAIN, batch_size=2, parameters={"balanced": True}
         )
 
 
-def test_balanced_seven():
-    dr = BalancedImageDataReader(
-        folder=os.path.join("tests", "test_data", "image")
+def test_balanced_seven(isolated_image_dir, extra_angry_files):
+    dr = BalancedImageDataReader(folder=str(isolated_image_dir))
+    class_counts = np.zeros(7, dtype=int)
+    dataset = dr.get_emotion_data(
+        "neutral_ekman",
+        Set.TRAIN,
+        batch_size=14,
+        parameters={"balanced": True, "shuffle": True},
     )
-    class_counts = [0] * 7
-    try:
-        import shutil
-
-        for i in range(7):
-            shutil.copyfile(
-                os.path.join(
-                    "tests",
-                    "test_data",
-                    "image",
-                    "train",
-                    "angry",
-                    "fer_35854.jpeg",
-                ),
-                os.path.join(
-                    "tests",
-                    "test_data",
-                    "image",
-                    "train",
-                    "angry",
-                    f"fer_35854_copy{i}.jpeg",
-                ),
-            )
-        # Protected with additional files
-
-        dataset = dr.get_emotion_data(
-            "neutral_ekman",
-            Set.TRAIN,
-            batch_size=1,
-            parameters={"balanced": True, "shuffle": True},
+    for iteration in range(100):
+        labels = np.concatenate(
+            [np.argmax(label.numpy(), axis=1) for _, label in dataset],
+            axis=0,
         )
-        for iteration in range(100):
-            for image, label in dataset:
-                label = np.argmax(label.numpy(), axis=1)[0]
-                class_counts[label] += 1
-
-        # End protected with additional files
-        for i in range(7):
-            os.remove(
-                os.path.join(
-                    "tests",
-                    "test_data",
-                    "image",
-                    "train",
-                    "angry",
-                    f"fer_35854_copy{i}.jpeg",
-                )
-            )
-    except BaseException as e:
-        for i in range(7):
-            if os.path.exists(
-                os.path.join(
-                    "tests",
-                    "test_data",
-                    "image",
-                    "train",
-                    "angry",
-                    f"fer_35854_copy{i}.jpeg",
-                )
-            ):
-                os.remove(
-                    os.path.join(
-                        "tests",
-                        "test_data",
-                        "image",
-                        "train",
-                        "angry",
-                        f"fer_35854_copy{i}.jpeg",
-                    )
-                )
-        raise e
+        class_counts += np.bincount(labels, minlength=7)
 
     assert sum(class_counts) == 1400
     assert max(class_counts) <= 250
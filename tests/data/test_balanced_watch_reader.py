@@ -26,7 +26,7 @@ def test_unbalanced_data():
     unbalanced_reader = WatchExperimentDataReader(
         folder=os.path.join("tests", "test_data", "watch")
     )
-    parameters = {"balanced": False, "shuffle": False}
+    parameters = {"balanced": False, "shuffle": False, "cache": False}
 
     balanced_dataset = reader.get_seven_emotion_data(Set.TRAIN, 16, parameters)
     unbalanced_dataset = unbalanced_reader.get_seven_emotion_data(
@@ -48,8 +48,10 @@ def test_unbalanced_data():
         assert np.array_equal(bal_data, unb_data)
         assert np.array_equal(unb_labels, bal_labels)
 
-    balanced_labels = reader.get_labels(Set.TEST)
-    unbalanced_labels = unbalanced_reader.get_labels(Set.TEST)
+    balanced_labels = reader.get_labels(Set.TEST, parameters)
+    unbalanced_labels = unbalanced_reader.get_labels(
+        Set.TEST, parameters
+    )
     assert np.array_equal(balanced_labels, unbalanced_labels)
 
 
@@ -57,7 +59,7 @@ def test_balanced_three():
     reader = BalancedWatchExperimentDataReader(
         folder=os.path.join("tests", "test_data", "watch")
     )
-    parameters = {"balanced": True, "shuffle": False}
+    parameters = {"balanced": True, "shuffle": False, "cache": False}
     with pytest.raises(NotImplementedError):
         reader.get_three_emotion_data(Set.VAL, 16, parameters)
 
@@ -68,7 +70,7 @@ def test_balanced_data():
     reader = BalancedWatchExperimentDataReader(
         folder=os.path.join("tests", "test_data", "watch")
     )
-    parameters = {"balanced": True, "shuffle": True}
+    parameters = {"balanced": True, "shuffle": True, "cache": False}
     dataset = reader.get_seven_emotion_data(Set.TRAIN, 16, parameters)
     total_count = 55
     iterations = 100
@@ -9,6 +9,11 @@ import tensorflow as tf
 from src.data.text_data_reader import Set, TextDataReader
 
 
+@pytest.fixture(scope="module")
+def text_dr():
+    return TextDataReader(folder=os.path.join("tests", "test_data", "text"))
+
+
 def test_initialization():
     dr = TextDataReader()
     assert dr.name == "text"
@@ -18,60 +23,50 @@ def test_initialization():
     dr.cleanup()
 
 
-def test_reading():
-    dr = TextDataReader(folder=os.path.join("tests", "test_data", "text"))
-    assert dr.folder == os.path.join("tests", "test_data", "text")
-    dataset = dr.get_emotion_data("neutral_ekman", Set.TRAIN, batch_size=5)
+def test_reading(text_dr):
+    assert text_dr.folder == os.path.join("tests", "test_data", "text")
+    dataset = text_dr.get_emotion_data(
+        "neutral_ekman", Set.TRAIN, batch_size=5
+    )
     assert isinstance(dataset, tf.data.Dataset)
     batch = 0
     for texts, labels in dataset:
         batch += 1
-        assert texts.numpy().shape == (5, 1)
-        assert labels.numpy().shape == (5, 7)
-        for text in texts.numpy():
-            text = str(text)
-            assert len(text) > 5
-        for label in labels.numpy():
-            assert label.shape == (7,)
-            assert np.sum(label) == 1
+        texts = texts.numpy()
+        labels = labels.numpy()
+        assert texts.shape == (5, 1)
+        assert labels.shape == (5, 7)
+        assert (np.vectorize(len)(texts) > 5).all()
+        assert np.array_equal(labels.sum(axis=1), np.ones(5))
     assert batch == 6
 
     with pytest.raises(ValueError):
-        _ = dr.get_emotion_data("wrong")
+        _ = text_dr.get_emotion_data("wrong")
 
 
-def test_reading_three():
-    dr = TextDataReader(folder=os.path.join("tests", "test_data", "text"))
-    assert dr.folder == os.path.join("tests", "test_data", "text")
-    dataset = dr.get_emotion_data("three", Set.TRAIN, batch_size=4)
+def test_reading_three(text_dr):
+    assert text_dr.folder == os.path.join("tests", "test_data", "text")
+    dataset = text_dr.get_emotion_data("three", Set.TRAIN, batch_size=4)
     assert isinstance(dataset, tf.data.Dataset)
     batch = 0
     for texts, labels in dataset:
         batch += 1
+        texts = texts.numpy()
+        labels = labels.numpy()
         if batch <= 7:
-            assert texts.numpy().shape == (4, 1)
-            assert labels.numpy().shape == (4, 3)
-            for text in texts.numpy():
-                text = str(text)
-                assert len(text) > 5
-            for label in labels.numpy():
-                assert label.shape == (3,)
-                assert np.sum(label) == 1
+            assert texts.shape == (4, 1)
+            assert labels.shape == (4, 3)
+            assert np.array_equal(labels.sum(axis=1), np.ones(4))
         elif batch == 8:
-            assert texts.numpy().shape == (2, 1)
-            assert labels.numpy().shape == (2, 3)
-            for text in texts.numpy():
-                text = str(text)
-                assert len(text) > 5
-            for label in labels.numpy():
-                assert label.shape == (3,)
-                assert np.sum(label) == 1
+            assert texts.shape == (2, 1)
+            assert labels.shape == (2, 3)
+            assert np.array_equal(labels.sum(axis=1), np.ones(2))
+        assert (np.vectorize(len)(texts) > 5).all()
     assert batch == 8
 
 
-def test_labels():
-    dr = TextDataReader(folder=os.path.join("tests", "test_data", "text"))
-    dataset = dr.get_emotion_data(
+def test_labels(text_dr):
+    dataset = text_dr.get_emotion_data(
         "neutral_ekman", Set.TRAIN, batch_size=5, parameters={"shuffle": False}
     )
     dataset_labels = np.empty((0,))
@@ -86,7 +81,7 @@ def test_labels():
         labels = np.argmax(labels, axis=1)
         assert labels.shape == (5,)
         dataset_labels = np.concatenate([dataset_labels, labels], axis=0)
-    true_labels = dr.get_labels(Set.TRAIN)
+    true_labels = text_dr.get_labels(Set.TRAIN)
     assert true_labels.shape == (30,)
     assert dataset_labels.shape == (30,)
     assert np.array_equal(true_labels, dataset_labels)
@@ -95,7 +90,7 @@ def test_labels():
     assert np.array_equal(d_labels, dataset_raw_labels)
 
     # Now with shuffle
-    dataset = dr.get_emotion_data(
+    dataset = text_dr.get_emotion_data(
         "neutral_ekman", Set.TRAIN, batch_size=5, parameters={"shuffle": True}
     )
     dataset_labels = np.empty((0,))
@@ -27,7 +27,7 @@ def test_get_raw_data():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="expected",
     )
-    reader.get_raw_data({})
+    reader.get_raw_data({"cache": False})
     assert reader.raw_data.shape == (97, 20, 5)
     assert reader.raw_labels.shape == (97,)
     expected_labels = reader.raw_labels
@@ -36,7 +36,7 @@ def test_get_raw_data():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="faceapi",
     )
-    reader.get_raw_data({})
+    reader.get_raw_data({"cache": False})
     assert reader.raw_data.shape == (97, 20, 5)
     assert reader.raw_labels.shape == (97,)
     faceapi_labels = reader.raw_labels
@@ -47,7 +47,7 @@ def test_get_raw_data():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="both",
     )
-    reader.get_raw_data({})
+    reader.get_raw_data({"cache": False})
     assert reader.raw_data.shape == (both_labels.shape[0], 20, 5)
     assert reader.raw_labels.shape == (both_labels.shape[0],)
     assert np.array_equal(both_labels, reader.raw_labels)
@@ -59,7 +59,7 @@ def test_normalization():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="expected",
     )
-    reader.get_raw_data({})
+    reader.get_raw_data({"cache": False})
 
     assert np.mean(reader.raw_data[:, :, 0], axis=(0, 1)) == pytest.approx(
         0, abs=0.2
@@ -98,7 +98,9 @@ def test_get_data():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="expected",
     )
-    data = reader.get_seven_emotion_data(Set.TRAIN, 8, {"shuffle": True})
+    data = reader.get_seven_emotion_data(
+        Set.TRAIN, 8, {"shuffle": True, "cache": False}
+    )
     assert isinstance(data, tf.data.Dataset)
     for batch, labels in data:
         assert batch.shape[1] == 20
@@ -114,7 +116,7 @@ def test_get_cv_indices():
         folder=os.path.join("tests", "test_data", "watch"),
         default_label_mode="expected",
     )
-    reader.get_raw_data({})
+    reader.get_raw_data({"cache": False})
     counts = [13, 8, 6, 8, 35, 20, 7]
     order = [6, 3, 2, 0, 1, 5, 4]
     all_cv_indices = reader.get_cross_validation_indices(Set.ALL, {})
@@ -152,7 +154,9 @@ def test_get_cv_indices():
         assert len(test_set.intersection(val_set)) == 0
 
     expected_labels = reader.raw_labels[expected_indices]
-    assert np.array_equal(reader.get_labels(Set.ALL, {}), expected_labels)
+    assert np.array_equal(
+        reader.get_labels(Set.ALL, {"cache": False}), expected_labels
+    )
 
 
 @pytest.mark.filterwarnings("ignore:Happimeter data:UserWarning")
@@ -165,13 +169,13 @@ def test_reading_three():
         "three",
         Set.VAL,
         batch_size=1,
-        parameters={"shuffle": False},
+        parameters={"shuffle": False, "cache": False},
     )
     seven_dataset = dr.get_emotion_data(
         "neutral_ekman",
         Set.VAL,
         batch_size=1,
-        parameters={"shuffle": False},
+        parameters={"shuffle": False, "cache": False},
     ).as_numpy_iterator()
     assert isinstance(dataset, tf.data.Dataset)
     batch = 0
@@ -197,7 +201,7 @@ def test_raw_generator():
     dr = WatchExperimentDataReader(
         folder=os.path.join("tests", "test_data", "watch")
     )
-    dr.get_raw_data({})
+    dr.get_raw_data({"cache": False})
     generator = dr.get_data_generator(Set.TEST, {})
     for data, labels in generator():
         assert data.shape == (